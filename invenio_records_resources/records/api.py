@@ -159,16 +159,36 @@ class FileRecord(RecordBase, SystemFieldsMixin):
                 return cls(obj.data, model=obj)
 
     @classmethod
-    def list_by_record(cls, record_id, with_deleted=False):
-        """List all record files by record ID."""
-        with db.session.no_autoflush:
-            query = cls.model_cls.query.filter(cls.model_cls.record_id == record_id)
-
-            if not with_deleted:
-                query = query.filter(cls.model_cls.is_deleted != True)
+    def list_by_record(cls, record_id, with_deleted=False, batch_size=None):
+        """List all record files by record ID.
 
-            for obj in query:
+        :param batch_size: If set, the files are listed ordered by id with one
+            query per batch of this size. Each batch is fully fetched, so no
+            cursor is left open while the caller consumes the files.
+        """
+        query = cls.model_cls.query.filter(cls.model_cls.record_id == record_id)
+
+        if not with_deleted:
+            query = query.filter(cls.model_cls.is_deleted != True)
+
+        if not batch_size:
+            with db.session.no_autoflush:
+                for obj in query:
+                    yield cls(obj.data, model=obj)
+            return
+
+        last_id = None
+        while True:
+            batch_query = query
+            if last_id is not None:
+                batch_query = batch_query.filter(cls.model_cls.id > last_id)
+            with db.session.no_autoflush:
+                batch = batch_query.order_by(cls.model_cls.id).limit(batch_size).all()
+            for obj in batch:
                 yield cls(obj.data, model=obj)
+            if len(batch) < batch_size:
+                return
+            last_id = batch[-1].id
 
     @property
     def file(self):
@@ -52,10 +52,11 @@ necessarily persisted in the metadata.
 """
 
 import uuid
-from collections.abc import MutableMapping
+from collections.abc import MutableMapping, ValuesView
 from datetime import datetime
 from functools import wraps
 
+from flask import current_app
 from invenio_db import db
 from invenio_files_rest.errors import (
     BucketLockedError,
@@ -63,7 +64,9 @@ from invenio_files_rest.errors import (
     InvalidOperationError,
 )
 from invenio_files_rest.models import Bucket, FileInstance, ObjectVersion
-from sqlalchemy import insert
+from invenio_records.signals import after_record_delete, before_record_delete
+from sqlalchemy import delete, insert, null, update
+from sqlalchemy.orm import joinedload
 
 
 def ensure_enabled(func):
@@ -78,6 +81,26 @@ def ensure_enabled(func):
     return inner
 
 
+class FilesValuesView(ValuesView):
+    """Lazy view over the file records of a files manager.
+
+    Unless the manager already loaded its entries, every iteration queries the
+    database again and fetches the file records in batches of ``batch_size``.
+    """
+
+    batch_size = 1000
+
+    def __iter__(self):
+        """File records iterator."""
+        entries = self._mapping._entries
+        if entries is not None:
+            yield from entries.values()
+        else:
+            yield from self._mapping.file_cls.list_by_record(
+                self._mapping.record.id, batch_size=self.batch_size
+            )
+
+
 class FilesManager(MutableMapping):
     """Files management dict-like wrapper."""
 
@@ -164,7 +187,12 @@ class FilesManager(MutableMapping):
         transfer=None,
         **kwargs,
     ):
-        """Create/initialize a file."""
+        """Create/initialize a file.
+
+        The top level of ``data`` and ``transfer`` is copied into the file
+        record, which may keep references to their nested values, so callers
+        must not mutate those after the call.
+        """
         assert not (obj and stream)
 
         if key in self:
@@ -176,18 +204,104 @@ class FilesManager(MutableMapping):
         if obj:
             if isinstance(obj, dict):
                 fi = FileInstance.create()
-                fi.set_uri(**obj.pop("file"))
+                fi.set_uri(**obj["file"])
                 obj = ObjectVersion.create(self.bucket, key, fi.id)
             rf.object_version_id = obj.version_id
             rf.object_version = obj
         if data:
             rf.update(data)
         if transfer:
-            rf.transfer = transfer
+            rf.transfer = dict(transfer)
         rf.commit()
         self._entries[key] = rf
         return rf
 
+    @ensure_enabled
+    def bulk_create(self, files_data):
+        """Create/initialize multiple files with a single insert.
+
+        Each item of ``files_data`` is a file metadata dictionary holding the
+        ``key`` and optionally the ``transfer`` of the file. The rest of the
+        item is stored as the file record data. The file record extensions are
+        run and the data is validated as in ``create()``, only the rows are
+        written with one insert. The items themselves are left untouched.
+
+        :returns: The list of created file records, in the same order.
+        """
+        entries = self.entries
+        record_id = self.record.id
+        file_cls = self.file_cls
+        model_cls = file_cls.model_cls
+        now = datetime.utcnow()
+
+        # run the hooks in the same order as create(), one phase at a time
+        items, keys = [], set()
+        for file_data in files_data:
+            data = dict(file_data)
+            key = data.pop("key")
+            transfer = data.pop("transfer", None)
+            if key in entries or key in keys:
+                raise InvalidKeyError(
+                    description=f"File with key {key} already exists."
+                )
+            keys.add(key)
+
+            rf = file_cls(
+                {},
+                model=model_cls(id=uuid.uuid4(), data={}),
+                key=key,
+                record_id=record_id,
+            )
+            for e in file_cls._extensions:
+                e.pre_create(rf)
+            items.append((rf, data, transfer))
+
+        if not items:
+            return []
+
+        for rf, _, _ in items:
+            for e in file_cls._extensions:
+                e.post_create(rf)
+
+        rows = []
+        for rf, data, transfer in items:
+            if data:
+                rf.update(data)
+            if transfer:
+                rf.transfer = dict(transfer)
+            for e in file_cls._extensions:
+                e.pre_commit(rf)
+            rows.append(
+                {
+                    "id": rf.id,
+                    "created": now,
+                    "updated": now,
+                    "key": rf.key,
+                    "record_id": record_id,
+                    "version_id": 1,
+                    # validate also encodes the data
+                    "json": rf._validate(),
+                }
+            )
+
+        db.session.execute(insert(model_cls), rows)
+
+        # load the inserted rows in one query to attach them to the records
+        models = {
+            obj.id: obj
+            for obj in model_cls.query.filter(
+                model_cls.id.in_([row["id"] for row in rows])
+            )
+        }
+        rfs = [rf for rf, _, _ in items]
+        for rf in rfs:
+            rf.model = models[rf.id]
+            entries[rf.key] = rf
+        for rf in rfs:
+            for e in file_cls._extensions:
+                e.post_commit(rf)
+        return rfs
+
     @ensure_enabled
     def create_obj(self, key, stream, data=None, **kwargs):
         """Create an ObjectVersion but do not pop it to the top of the stack."""
@@ -196,7 +310,25 @@ class FilesManager(MutableMapping):
         if rf is None:
             raise InvalidKeyError(description=f"File with {key} does not exist.")
 
-        return ObjectVersion.create(self.bucket, key, stream=stream, **kwargs)
+        bucket = self.bucket
+        if bucket.locked:
+            raise BucketLockedError()
+
+        # Write the content to the storage before creating the object version,
+        # so that the previous head version and the bucket rows are not locked
+        # for the whole duration of the upload.
+        mimetype = kwargs.pop("mimetype", None)
+        if kwargs.get("size_limit") is None:
+            kwargs["size_limit"] = bucket.size_limit
+        fi = FileInstance.create()
+        fi.set_contents(
+            stream,
+            default_location=bucket.location.uri,
+            default_storage_class=bucket.default_storage_class,
+            **kwargs,
+        )
+
+        return ObjectVersion.create(bucket, key, _file_id=fi, mimetype=mimetype)
 
     @ensure_enabled
     def update(self, key, obj=None, stream=None, data=None, **kwargs):
@@ -217,11 +349,25 @@ class FilesManager(MutableMapping):
 
     @ensure_enabled
     def commit(self, file_key):
-        """Commit a file."""
-        file_obj = ObjectVersion.get(self.bucket.id, file_key)
+        """Commit a file and return its file record."""
+        # same as `ObjectVersion.get`, but also loads the file instance which is
+        # read right after committing (e.g. to check the file size)
+        file_obj = (
+            ObjectVersion.query.options(joinedload(ObjectVersion.file))
+            .filter(
+                ObjectVersion.bucket_id == self.bucket.id,
+                ObjectVersion.key == file_key,
+                ObjectVersion.is_head.is_(True),
+                ObjectVersion.file_id.isnot(None),
+            )
+            .one_or_none()
+        )
         if not file_obj:
             raise Exception(f"File with key {file_key} not uploaded yet.")
-        self[file_key] = file_obj
+        # same as `self[file_key] = file_obj`, but returns the file record
+        if file_key in self:
+            return self.update(file_key, obj=file_obj)
+        return self.create(file_key, obj=file_obj)
 
     @ensure_enabled
     def delete(self, key, remove_obj=True, softdelete_obj=True, remove_rf=False):
@@ -255,16 +401,73 @@ class FilesManager(MutableMapping):
             self._order.remove(key)
         return rf
 
+    @ensure_enabled
+    def bulk_delete(self, keys, remove_obj=True, softdelete_obj=True, remove_rf=False):
+        """Delete multiple files.
+
+        Same as calling ``delete()`` for each key, but the file records are
+        (soft) deleted with a single statement. The file record delete signals
+        and extensions are run for each file record around that statement.
+
+        :param keys: The file names to delete.
+        :returns: The list of updated file records.
+        """
+        keys = list(keys)
+        rfs = [self[key] for key in keys]
+        if not rfs:
+            return []
+        ovs = [rf.object_version for rf in rfs]
+
+        file_cls = self.file_cls
+        for rf in rfs:
+            if file_cls.send_signals:
+                before_record_delete.send(current_app._get_current_object(), record=rf)
+            for e in file_cls._extensions:
+                e.pre_delete(rf, force=remove_rf)
+
+        # Remove or softdelete the entire rows
+        model_cls = file_cls.model_cls
+        ids = [rf.id for rf in rfs]
+        if remove_rf:
+            stmt = delete(model_cls).where(model_cls.id.in_(ids))
+        else:
+            stmt = (
+                update(model_cls)
+                .where(model_cls.id.in_(ids))
+                .values(json=null(), version_id=model_cls.version_id + 1)
+            )
+        db.session.execute(stmt, execution_options={"synchronize_session": "fetch"})
+
+        for rf, ov in zip(rfs, ovs):
+            if ov and remove_obj:
+                if softdelete_obj:
+                    ObjectVersion.delete(ov.bucket, ov.key)
+                else:
+                    ov.remove()
+            del self._entries[rf.key]
+
+        for rf in rfs:
+            if file_cls.send_signals:
+                after_record_delete.send(current_app._get_current_object(), record=rf)
+            for e in file_cls._extensions:
+                e.post_delete(rf, force=remove_rf)
+
+        # Unset the default preview if the file is removed
+        deleted_keys = set(keys)
+        if self.default_preview in deleted_keys:
+            self.default_preview = None
+        self._order = [key for key in self._order if key not in deleted_keys]
+        return rfs
+
     @ensure_enabled
     def delete_all(self, remove_obj=True, softdelete_obj=True, remove_rf=False):
         """Delete all file records."""
-        for key in list(self.keys()):
-            self.delete(
-                key,
-                remove_obj=remove_obj,
-                softdelete_obj=softdelete_obj,
-                remove_rf=remove_rf,
-            )
+        self.bulk_delete(
+            list(self.keys()),
+            remove_obj=remove_obj,
+            softdelete_obj=softdelete_obj,
+            remove_rf=remove_rf,
+        )
 
     def teardown(self, full=True):
         """Clean up all file manager related instances.
@@ -391,6 +594,16 @@ class FilesManager(MutableMapping):
                     obj_or_key = dest_rf.object_version
                     self[key] = obj_or_key, dict(src_rf)
 
+    @ensure_enabled
+    def itervalues(self):
+        """Return a lazy view over the file records.
+
+        Contrary to ``values()``, the file records are not kept in the entries
+        cache, so they can be released once consumed. Iterate the view once, as
+        each iteration queries the database again.
+        """
+        return FilesValuesView(self)
+
     @property
     def entries(self):
         """Return file entries dictionary."""
@@ -476,17 +689,30 @@ class FilesManager(MutableMapping):
         self._order = new_order
 
     @ensure_enabled
-    def __getitem__(self, key):
-        """Get a file by key/filename."""
+    def get(self, key, default=None):
+        """Get a file by key/filename, or ``default`` if it does not exist."""
         value = self.entries.get(key)
         if isinstance(value, self.file_cls):
             return value
         else:  # fetch from db...
             value = self.file_cls.get_by_key(self.record.id, key)
-            if value:
+            if value is not None:
                 self._entries[key] = value
                 return value
-        raise KeyError(f'No file with key "{key}"')
+        return default
+
+    @ensure_enabled
+    def __getitem__(self, key):
+        """Get a file by key/filename."""
+        value = self.get(key)
+        if value is None:
+            raise KeyError(f'No file with key "{key}"')
+        return value
+
+    @ensure_enabled
+    def __contains__(self, key):
+        """Check if a file exists, without raising a ``KeyError`` on a miss."""
+        return self.get(key) is not None
 
     def _parse_set_value(self, value):
         obj, stream, data = None, None, None
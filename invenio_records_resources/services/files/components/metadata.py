@@ -15,6 +15,7 @@ from invenio_files_rest.errors import FileSizeError
 from ....proxies import current_transfer_registry
 from ...errors import FilesCountExceededException
 from ...uow import RecordCommitOp
+from ..transfer import Transfer
 from .base import FileServiceComponent
 
 
@@ -35,17 +36,34 @@ class FileMetadataComponent(FileServiceComponent):
                     max_files=maxFiles, resulting_files_count=resulting_files_count
                 )
 
+        bulk_files = []
         for file_metadata in data:
+            transfer_type = file_metadata["transfer"]["type"]
+            transfer_cls = current_transfer_registry.get_transfer_class(transfer_type)
+
+            # transfers that do not customize the initialization only create the
+            # file record, so consecutive ones can be inserted all at once
+            if transfer_cls.init_file is Transfer.init_file:
+                bulk_files.append(file_metadata)
+                continue
+
+            # insert the pending files first to keep the files in input order
+            if bulk_files:
+                record.files.bulk_create(bulk_files)
+                bulk_files = []
+
             transfer = current_transfer_registry.get_transfer(
                 record=record,
                 file_service=self.service,
                 key=file_metadata["key"],
-                transfer_type=file_metadata["transfer"]["type"],
+                transfer_type=transfer_type,
                 uow=self.uow,
             )
-
             _ = transfer.init_file(record, file_metadata)
 
+        if bulk_files:
+            record.files.bulk_create(bulk_files)
+
     def update_file_metadata(self, identity, id_, file_key, record, data):
         """Update file metadata handler."""
         schema = self.service.file_schema.schema(many=False)
@@ -63,17 +81,18 @@ class FileMetadataComponent(FileServiceComponent):
 
     def commit_file(self, identity, id_, file_key, record):
         """Commit file handler."""
+        file_record = record.files.get(file_key)
         transfer = current_transfer_registry.get_transfer(
             record=record,
-            file_record=record.files.get(file_key),
+            file_record=file_record,
             file_service=self.service,
             uow=self.uow,
         )
 
         transfer.commit_file()
 
-        f_obj = record.files.get(file_key)
-        f_inst = getattr(f_obj, "file", None)
+        # the file record is updated in place when committing the file
+        f_inst = getattr(file_record, "file", None)
         file_size = getattr(f_inst, "size", None)
         if file_size == 0:
             allow_empty_files = current_app.config.get(
@@ -98,14 +98,15 @@ class FileList(ServiceListResult):
     @property
     def entries(self):
         """Iterator over the hits."""
+        # the dump context is the same for all the entries
+        schema = self._service.file_schema.dumper(
+            context=dict(
+                identity=self._identity, record=self._record, service=self._service
+            )
+        )
         for entry in self._results:
             # Project the record
-            projection = self._service.file_schema.dump(
-                entry,
-                context=dict(
-                    identity=self._identity, record=self._record, service=self._service
-                ),
-            )
+            projection = schema.dump(entry)
 
             # create links
             if self._links_item_tpl:
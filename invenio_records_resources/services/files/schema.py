@@ -163,12 +163,19 @@ class InitFileSchemaMixin(Schema):
             # should be a dictionary, otherwise there will be validation error later on
             return data
 
-        data.setdefault("transfer", {})
-        if not isinstance(data["transfer"], dict):
+        transfer = data.get("transfer", {})
+        if not isinstance(transfer, dict):
             raise ValidationError(
                 {"transfer": "Transfer metadata must be a dictionary."}
             )
-        data["transfer"].setdefault(
-            "type", current_transfer_registry.default_transfer_type
-        )
-        return data
+        if "type" in transfer:
+            return data
+
+        # shallow copies of the levels we modify, so that the input is not mutated
+        return {
+            **data,
+            "transfer": {
+                **transfer,
+                "type": current_transfer_registry.default_transfer_type,
+            },
+        }
@@ -10,9 +10,13 @@
 
 """File Service API."""
 
-from flask import current_app
+from collections import OrderedDict
+from functools import cached_property
+
+from flask import current_app, g
 from invenio_i18n import gettext as _
 from marshmallow import ValidationError
+from sqlalchemy import inspect
 
 from ..base import LinksTemplate, Service
 from ..errors import FailedFileUploadException, FileKeyNotFoundError
@@ -20,6 +24,9 @@ from ..records.schema import ServiceSchemaWrapper
 from ..uow import RecordCommitOp, unit_of_work
 from .schema import InitFileSchemaMixin
 
+RESOLVED_RECORDS_CACHE_SIZE = 4
+"""Number of resolved records kept for reuse by consecutive file reads."""
+
 
 class FileService(Service):
     """A service for adding files support to records."""
@@ -29,7 +36,7 @@ class FileService(Service):
         """Get the record class."""
         return self.config.record_cls
 
-    @property
+    @cached_property
     def file_schema(self):
         """Returns the data schema instance.
 
@@ -39,7 +46,7 @@ class FileService(Service):
         """
         return ServiceSchemaWrapper(self, schema=self.config.file_schema)
 
-    @property
+    @cached_property
     def initial_file_schema(self):
         """Returns the data schema instance for initiating the file upload."""
         if not hasattr(self.config, "initial_file_schema"):
@@ -84,41 +91,107 @@ class FileService(Service):
         action_name = self.config.permission_action_prefix + action_name
         return super().check_permission(identity, action_name, **kwargs)
 
-    def _get_record(self, id_, identity, action, file_key=None):
+    def _resolve_record(self, id_, cached=False):
+        """Resolve the record.
+
+        With ``cached``, a record resolved earlier in the same application context
+        is reused, as long as it was not changed or expired (e.g. by a database
+        commit) since. Only the few most recently resolved records are kept.
+        Without ``cached``, the record is always resolved again and dropped from
+        the cache, as the caller is about to change it.
+        """
+        records = g.setdefault("_files_service_records", OrderedDict())
+        cache_key = (self.record_cls, id_)
+
+        record, version_id, grants = records.pop(cache_key, (None, None, None))
+        if not cached or record is None:
+            record = None
+        elif inspect(record.model).expired_attributes:
+            record = None
+        elif record.model.version_id != version_id:
+            record = None
+
+        if record is None:
+            # FIXME: Remove "registered_only=False" since it breaks access to an
+            # unpublished record.
+            record = self.record_cls.pid.resolve(id_, registered_only=False)
+            # permissions granted on a record are dropped together with it
+            grants = set()
+        if cached:
+            records[cache_key] = (record, record.model.version_id, grants)
+            # evict the least recently resolved records
+            while len(records) > RESOLVED_RECORDS_CACHE_SIZE:
+                records.popitem(last=False)
+        return record
+
+    def _get_record(self, id_, identity, action, file_key=None, cached=False):
         """Get the associated record.
 
         If a ``file_key`` is specified and the record in question doesn't have a file
         for that key, a ``FileKeyNotFoundError`` will be raised.
         """
-        # FIXME: Remove "registered_only=False" since it breaks access to an
-        # unpublished record.
-        record = self.record_cls.pid.resolve(id_, registered_only=False)
+        record = self._resolve_record(id_, cached=cached)
 
         # note: we check file existence before checking permissions, as permission
         # checks may require the file to exist (e.g. IfTransferType permission)
         # and if it does not exist, will return a permission denied, resulting in 403
         # status code. By reveresing the order, we can return a more specific
         # 404 status code.
-        if file_key and file_key not in record.files:
-            raise FileKeyNotFoundError(id_, file_key)
-
-        self.require_permission(identity, action, record=record, file_key=file_key)
+        file_record = None
+        if file_key:
+            file_record = record.files.get(file_key)
+            if file_record is None:
+                raise FileKeyNotFoundError(id_, file_key)
+
+        self._require_permission_cached(
+            identity, action, id_, record, file_key, file_record
+        )
 
         return record
 
+    def _require_permission_cached(
+        self, identity, action, id_, record, file_key=None, file_record=None
+    ):
+        """Require a permission, reusing a grant on the cached record.
+
+        Grants are only kept for a record cached by ``_resolve_record``, and are
+        dropped together with it, i.e. when it is evicted, changed or resolved
+        for a write. The revision of the file record is part of the grant, so
+        that any change to it (e.g. of the transfer type) evaluates the
+        permission again. Denials are never cached.
+        """
+        records = g.get("_files_service_records", {})
+        _record, _version_id, grants = records.get(
+            (self.record_cls, id_), (None, None, None)
+        )
+        if _record is not record:
+            self.require_permission(identity, action, record=record, file_key=file_key)
+            return
+
+        file_revision = None
+        if file_record is not None:
+            file_revision = (file_record.id, file_record.revision_id)
+
+        grant = (self, identity, action, file_key, file_revision)
+        if grant in grants:
+            return
+
+        self.require_permission(identity, action, record=record, file_key=file_key)
+        grants.add(grant)
+
     #
     # High-level API
     #
     def list_files(self, identity, id_):
         """List the files of a record."""
-        record = self._get_record(id_, identity, "read_files")
+        record = self._get_record(id_, identity, "read_files", cached=True)
 
         self.run_components("list_files", id_, identity, record)
 
         return self.file_result_list(
             self,
             identity,
-            results=record.files.values(),
+            results=record.files.itervalues(),
             record=record,
             links_tpl=self.file_links_list_tpl(id_),
             links_item_tpl=self.file_links_item_tpl(id_),
@@ -138,7 +211,7 @@ class FileService(Service):
             raise ValidationError("No files to upload.")
 
         # resolve the record and check permissions for each uploaded file
-        record = self.record_cls.pid.resolve(id_, registered_only=False)
+        record = self._resolve_record(id_)
 
         for created_file in data:
             self.require_permission(
@@ -181,7 +254,9 @@ class FileService(Service):
 
         :raises FileKeyNotFoundError: If the record has no file for the ``file_key``
         """
-        record = self._get_record(id_, identity, "read_files", file_key=file_key)
+        record = self._get_record(
+            id_, identity, "read_files", file_key=file_key, cached=True
+        )
 
         self.run_components("read_file_metadata", identity, id_, file_key, record)
 
@@ -272,7 +347,7 @@ class FileService(Service):
         # We have to separate the gathering of the keys from their deletion
         # because of how record.files is implemented.
         file_keys = [fk for fk in record.files]
-        results = [record.files.delete(file_key) for file_key in file_keys]
+        results = record.files.bulk_delete(file_keys)
 
         self.run_components("delete_all_files", identity, id_, record, results, uow=uow)
 
@@ -331,7 +406,9 @@ class FileService(Service):
 
         :raises FileKeyNotFoundError: If the record has no file for the ``file_key``
         """
-        record = self._get_record(id_, identity, "get_content_files", file_key=file_key)
+        record = self._get_record(
+            id_, identity, "get_content_files", file_key=file_key, cached=True
+        )
 
         self.run_components("get_file_content", identity, id_, file_key, record)
 
@@ -346,7 +423,7 @@ class FileService(Service):
     def get_transfer_metadata(self, identity, id_, file_key):
         """Retrieve file transfer metadata."""
         record = self._get_record(
-            id_, identity, "get_file_transfer_metadata", file_key=file_key
+            id_, identity, "get_file_transfer_metadata", file_key=file_key, cached=True
         )
         file = record.files[file_key]
         transfer_metadata = dict(file.transfer)
@@ -23,6 +23,7 @@ from invenio_files_rest.proxies import current_files_rest
 from ...proxies import current_service_registry
 from ...services.errors import FileKeyNotFoundError
 from ..errors import TransferException
+from ..uow import UnitOfWork
 from .transfer.constants import LOCAL_TRANSFER_TYPE
 
 
@@ -51,6 +52,8 @@ def fetch_file(service_id, record_id, file_key):
                         system_identity, record_id, file_key, transfer_metadata
                     )
                     return
+                # the content is committed on its own, so that if committing the
+                # file fails below, the error is recorded against the written file
                 service.set_file_content(
                     system_identity,
                     record_id,
@@ -59,11 +62,17 @@ def fetch_file(service_id, record_id, file_key):
                 )
                 transfer_metadata.pop("url")
                 transfer_metadata["type"] = LOCAL_TRANSFER_TYPE
-                service.update_transfer_metadata(
-                    system_identity, record_id, file_key, transfer_metadata
-                )
-                # commit file
-                service.commit_file(system_identity, record_id, file_key)
+                # group transfer metadata and commit file in one transaction
+                with UnitOfWork() as uow:
+                    service.update_transfer_metadata(
+                        system_identity,
+                        record_id,
+                        file_key,
+                        transfer_metadata,
+                        uow=uow,
+                    )
+                    service.commit_file(system_identity, record_id, file_key, uow=uow)
+                    uow.commit()
         except Exception as e:
             current_app.logger.error(e)
             transfer_metadata["error"] = str(e)
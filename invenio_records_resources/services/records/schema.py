@@ -99,7 +99,15 @@ class ServiceSchemaWrapper:
 
     def dump(self, data, schema_args=None, context=None):
         """Dump data using wrapped schema and dynamic schema_args + context."""
+        return self.dumper(schema_args=schema_args, context=context).dump(data)
+
+    def dumper(self, schema_args=None, context=None):
+        """Build the wrapped schema with dynamic schema_args + context.
+
+        The returned schema can be reused to dump several objects sharing the
+        same context.
+        """
         schema_args = schema_args or {}
         base_context = context or {}
         context = self._build_context(base_context)
-        return self.schema(context=context, **schema_args).dump(data)
+        return self.schema(context=context, **schema_args)
@@ -548,37 +548,44 @@ class RecordService(Service, RecordIndexerMixin):
         :param identity: the identity that will search and reindex.
         :param record_type: the record type with relations.
         :param records_info: a list of tuples containing (recid, uuid, revision_id)
-                             for each record to reindex.
+                             for each record to reindex, or a dict of parallel
+                             lists with the ``recids``, ``uuids`` and
+                             ``revision_ids`` keys.
         :param notif_time: reindex records index before this time.
-        :param limit: reindex in chunks of these records. The limit must be lower than
-                      the search engine maxClauseCount setting.
+        :param limit: match the related records in chunks of this size, and reindex
+                      up to this number of chunks per search. The limit must be
+                      lower than the search engine max_terms_count and
+                      maxClauseCount settings.
         :returns: True.
         """
         fieldpaths = self.config.relations.get(record_type, [])
-        clauses = []
-        for field in fieldpaths:
-            for record in records_info:
-                recid, uuid, revision_id = record
-                clauses.append(
-                    dsl.Q(
-                        "bool",
-                        must=[dsl.Q("term", **{f"{field}.id": recid})],
-                        must_not=[
-                            dsl.Q("term", **{f"{field}.@v": f"{uuid}::{revision_id}"})
-                        ],
-                    )
-                )
+        if not fieldpaths:
+            return True
 
-        filter = [dsl.Q("range", indexed_at={"lte": notif_time})]
+        id_fields = [f"{field}.id" for field in fieldpaths]
+        if isinstance(records_info, dict):
+            # only the recids are needed to find the records with relations
+            recids = records_info["recids"]
+        else:
+            recids = [recid for recid, _, _ in records_info]
         # split the list in chunks of `limit`, the last chunk will have the remaining
-        chunked_clauses = [
-            clauses[i : i + limit] for i in range(0, len(clauses), limit)
+        clauses = [
+            dsl.Q("terms", **{field: recids[i : i + limit]})
+            for i in range(0, len(recids), limit)
+            for field in id_fields
         ]
-        for chunked_clause in chunked_clauses:
+        # records indexed before the notification are stale, so there is no
+        # need to match them against the revision of each related record
+        filter = [dsl.Q("range", indexed_at={"lte": notif_time})]
+        # reindex up to `limit` chunks with a single search, so that records
+        # matching several chunks are only sent once to the indexer queue
+        for i in range(0, len(clauses), limit):
             search_query = dsl.Q(
-                "bool", minimum_should_match=1, should=chunked_clause, filter=filter
+                "bool",
+                minimum_should_match=1,
+                should=clauses[i : i + limit],
+                filter=filter,
             )
-
             self.reindex(identity, search_query=search_query)
         return True
 
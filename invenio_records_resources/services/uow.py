@@ -103,6 +103,8 @@ class and implementing the desired methods:
             # ... executed after the database transaction commit ...
 """
 
+from weakref import WeakKeyDictionary
+
 from celery import current_app
 
 # backwards compatible imports
@@ -119,6 +121,27 @@ from ..tasks import send_change_notifications
 __all__ = ["ModelCommitOp", "ModelDeleteOp", "Operation", "UnitOfWork", "unit_of_work"]
 
 
+#: Last indexing operation of each record, per unit of work.
+_last_record_index_ops = WeakKeyDictionary()
+
+
+def _record_index_key(record, indexer):
+    """Identify the index write of a record.
+
+    Records are identified by their class and id, as e.g. a draft and its
+    published record share the same id. Indexers are identified by their class,
+    record class and the index they write the record to.
+    """
+    record_to_index = getattr(indexer, "record_to_index", None)
+    return (
+        type(record),
+        record.id,
+        type(indexer),
+        getattr(indexer, "record_cls", None),
+        record_to_index(record) if record_to_index else None,
+    )
+
+
 #
 # Unit of work operations
 #
@@ -136,11 +159,31 @@ class RecordCommitOp(Operation):
         self._record.commit()
 
     def on_commit(self, uow):
-        """Run the operation."""
-        if self._indexer is not None:
+        """Run the operation.
+
+        If the same record is committed again later in the unit of work, only
+        the last operation indexes it.
+        """
+        if self._indexer is not None and not self._is_superseded(uow):
             arguments = {"refresh": True} if self._index_refresh else {}
             self._indexer.index(self._record, arguments=arguments)
 
+    def _is_superseded(self, uow):
+        """Check if a later operation indexes the same record the same way."""
+        last_ops = _last_record_index_ops.get(uow)
+        if last_ops is None:
+            last_ops = {}
+            for op in uow._operations:
+                if isinstance(op, RecordCommitOp) and op._indexer is not None:
+                    last_ops[_record_index_key(op._record, op._indexer)] = op
+            _last_record_index_ops[uow] = last_ops
+        key = _record_index_key(self._record, self._indexer)
+        last_op = last_ops.get(key, self)
+        # don't drop an index refresh requested by this operation
+        return last_op is not self and (
+            last_op._index_refresh or not self._index_refresh
+        )
+
 
 class RecordBulkCommitOp(Operation):
     """Record bulk commit operation with indexing."""
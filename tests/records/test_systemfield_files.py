@@ -10,8 +10,12 @@
 """Files field tests."""
 
 from io import BytesIO
+from unittest.mock import patch
 
+import pytest
+from invenio_files_rest.errors import InvalidKeyError
 from invenio_files_rest.models import Bucket, FileInstance, ObjectVersion
+from invenio_records.extensions import RecordExtension
 from invenio_records.systemfields import ConstantField, ModelField
 
 from invenio_records_resources.records.dumpers import PartialFileDumper
@@ -131,6 +135,136 @@ def test_record_files_operations(base_app, db, location):
     assert record["files"]["entries"] == {}
 
 
+def test_record_files_create_copies_transfer(base_app, db, location):
+    """Test the file record does not share the transfer passed on creation."""
+    record = Record.create({})
+    transfer = {"type": "L"}
+    rf = record.files.create("a.txt", transfer=transfer)
+
+    rf.transfer.transfer_type = "F"
+    assert transfer == {"type": "L"}
+
+
+def test_record_files_bulk_create(base_app, db, location):
+    """Test creation of several file records with a single insert."""
+    record = Record.create({})
+    record.files["existing.pdf"] = {"metadata": {"description": "Existing."}}
+
+    created = record.files.bulk_create(
+        [
+            {"key": "a.txt", "metadata": {"description": "A"}},
+            {
+                "key": "b.txt",
+                "metadata": {"description": "B"},
+                "transfer": {"type": "L"},
+            },
+        ]
+    )
+    db.session.commit()
+
+    assert [rf.key for rf in created] == ["a.txt", "b.txt"]
+    assert set(record.files) == {"existing.pdf", "a.txt", "b.txt"}
+    db_keys = {rf.key for rf in FileRecord.list_by_record(record.id)}
+    assert db_keys == {"existing.pdf", "a.txt", "b.txt"}
+    rf = record.files["b.txt"]
+    assert rf.record_id == record.id
+    assert rf.metadata == {"description": "B"}
+    assert rf.transfer.transfer_type == "L"
+    assert rf.object_version is None
+    db_transfers = {
+        rf.key: rf.get("transfer") for rf in FileRecord.list_by_record(record.id)
+    }
+    assert db_transfers["b.txt"] == {"type": "L"}
+
+    # the file record extensions run in the same order as in create()
+    class CreateSpy(RecordExtension):
+        calls = []
+
+        def pre_create(self, record):
+            self.calls.append(("pre_create", record.key))
+
+        def post_create(self, record):
+            self.calls.append(("post_create", record.key))
+            record["post_create"] = True
+
+        def pre_commit(self, record):
+            self.calls.append(("pre_commit", record.key))
+
+        def post_commit(self, record):
+            self.calls.append(("post_commit", record.key))
+
+    extensions = FileRecord._extensions + [CreateSpy()]
+    with patch.object(FileRecord, "_extensions", extensions):
+        record.files.bulk_create([{"key": "c.txt"}, {"key": "d.txt"}])
+    db.session.commit()
+
+    assert CreateSpy.calls == [
+        (hook, key)
+        for hook in ["pre_create", "post_create", "pre_commit", "post_commit"]
+        for key in ["c.txt", "d.txt"]
+    ]
+    db_files = {rf.key: rf for rf in FileRecord.list_by_record(record.id)}
+    assert db_files["c.txt"]["post_create"] is True
+
+    # duplicated keys are rejected
+    with pytest.raises(InvalidKeyError):
+        record.files.bulk_create([{"key": "a.txt"}])
+    with pytest.raises(InvalidKeyError):
+        record.files.bulk_create([{"key": "e.txt"}, {"key": "e.txt"}])
+
+
+def test_record_files_bulk_delete(base_app, db, location):
+    """Test deletion of several file records with a single statement."""
+    record = Record.create({})
+    record.files["f1.pdf"] = BytesIO(b"testfile")
+    record.files["f2.pdf"] = {"metadata": {"description": "Metadata only"}}
+    record.files["f3.pdf"] = {"metadata": {"description": "Kept"}}
+    record.files.default_preview = "f1.pdf"
+    record.files.order = ["f3.pdf", "f2.pdf", "f1.pdf"]
+    record.commit()
+    db.session.commit()
+
+    # soft delete
+    deleted = record.files.bulk_delete(["f1.pdf", "f2.pdf"])
+    record.commit()
+    db.session.commit()
+
+    assert [rf.key for rf in deleted] == ["f1.pdf", "f2.pdf"]
+    assert set(record.files) == {"f3.pdf"}
+    assert record.files.default_preview is None
+    assert record.files.order == ["f3.pdf"]
+    assert {rf.key for rf in FileRecord.list_by_record(record.id)} == {"f3.pdf"}
+    all_rfs = FileRecord.list_by_record(record.id, with_deleted=True)
+    assert {rf.key for rf in all_rfs} == {"f1.pdf", "f2.pdf", "f3.pdf"}
+    # the object version got a delete marker
+    assert ObjectVersion.get(record.bucket_id, "f1.pdf") is None
+
+    # hard delete, running the file record extensions
+    class DeleteSpy(RecordExtension):
+        calls = []
+
+        def pre_delete(self, record, force=False):
+            self.calls.append(("pre_delete", record.key, force))
+
+        def post_delete(self, record, force=False):
+            self.calls.append(("post_delete", record.key, force))
+
+    extensions = FileRecord._extensions + [DeleteSpy()]
+    with patch.object(FileRecord, "_extensions", extensions):
+        record.files.bulk_delete(["f3.pdf"], remove_rf=True)
+    record.commit()
+    db.session.commit()
+
+    assert DeleteSpy.calls == [
+        ("pre_delete", "f3.pdf", True),
+        ("post_delete", "f3.pdf", True),
+    ]
+
+    assert len(record.files) == 0
+    all_rfs = FileRecord.list_by_record(record.id, with_deleted=True)
+    assert {rf.key for rf in all_rfs} == {"f1.pdf", "f2.pdf"}
+
+
 def test_record_files_clear(base_app, db, location):
     """Test clearing record files (hard deletion)."""
     record = Record.create({})
@@ -458,3 +592,43 @@ def test_record_files_access_implicit_not_set(base_app, db, location):
     data = record.dumps()
     assert data["files"]["entries"][0].get("access") is None
     assert record.files["f1.txt"].model.json.get("access") is None
+
+
+def test_record_files_itervalues(base_app, db, location):
+    """Test lazy iteration over the file records."""
+    record = Record2.create({})
+    record.files["f1.pdf"] = BytesIO(b"testfile")
+    record.files["f2.pdf"] = BytesIO(b"testfile")
+    record.commit()
+    db.session.commit()
+
+    record = Record2.get_record(record.id)
+    values = record.files.itervalues()
+    assert {rf.key for rf in values} == {"f1.pdf", "f2.pdf"}
+    # the view can be iterated again and does not fill the entries cache
+    assert {rf.key for rf in values} == {"f1.pdf", "f2.pdf"}
+    assert record.files._entries is None
+    # the file records are fetched in batches
+    values.batch_size = 1
+    assert {rf.key for rf in values} == {"f1.pdf", "f2.pdf"}
+
+    # loaded entries are reused
+    assert set(record.files) == {"f1.pdf", "f2.pdf"}
+    assert all(a is b for a, b in zip(values, record.files.values()))
+
+
+def test_record_files_get(base_app, db, location):
+    """Test getting a file record without a KeyError on a miss."""
+    record = Record2.create({})
+    record.files["f1.pdf"] = BytesIO(b"testfile")
+    record.commit()
+    db.session.commit()
+
+    record = Record2.get_record(record.id)
+    assert record.files.get("f1.pdf") is record.files["f1.pdf"]
+    assert record.files.get("missing.pdf") is None
+    assert record.files.get("missing.pdf", "default") == "default"
+    assert "f1.pdf" in record.files
+    assert "missing.pdf" not in record.files
+    with pytest.raises(KeyError):
+        record.files["missing.pdf"]
@@ -13,16 +13,25 @@ from io import BytesIO
 from unittest.mock import patch
 
 import pytest
+from flask import g
 from flask_principal import Identity
 from invenio_access import any_user
 from invenio_access.permissions import system_identity
 from invenio_files_rest.errors import FileSizeError
+from invenio_files_rest.models import ObjectVersion
 from marshmallow import ValidationError
 
+from invenio_records_resources.records.systemfields.pid import PIDFieldContext
+from invenio_records_resources.services import FileService
 from invenio_records_resources.services.errors import (
     FileKeyNotFoundError,
     PermissionDeniedError,
 )
+from invenio_records_resources.services.files.service import (
+    RESOLVED_RECORDS_CACHE_SIZE,
+)
+from invenio_records_resources.services.records.schema import ServiceSchemaWrapper
+from tests.mock_module.api import RecordWithFiles
 from tests.mock_module.models import FileRecordMetadata
 
 #
@@ -197,6 +206,99 @@ def test_init_files(file_service, location, example_file_record, identity_simple
     assert second_entry["access"]["hidden"] is True
 
 
+def test_read_reuses_resolved_record(
+    file_service, location, example_file_record, identity_simple
+):
+    """Test that consecutive reads resolve the record only once."""
+    recid = example_file_record["id"]
+    file_service.init_files(identity_simple, recid, [{"key": "article.txt"}])
+
+    with patch.object(
+        PIDFieldContext, "resolve", autospec=True, side_effect=PIDFieldContext.resolve
+    ) as resolve:
+        file_service.list_files(identity_simple, recid)
+        file_service.read_file_metadata(identity_simple, recid, "article.txt")
+        file_service.get_transfer_metadata(system_identity, recid, "article.txt")
+        assert resolve.call_count == 1
+
+        # writes resolve the record again and drop it from the cache
+        file_service.update_file_metadata(
+            identity_simple, recid, "article.txt", {"metadata": {"foo": "bar"}}
+        )
+        assert resolve.call_count == 2
+        result = file_service.read_file_metadata(identity_simple, recid, "article.txt")
+        assert resolve.call_count == 3
+        assert result.to_dict()["metadata"] == {"foo": "bar"}
+
+
+def test_resolved_records_cache_is_bounded(
+    file_service, location, db, input_data, identity_simple
+):
+    """Test that only the most recently resolved records are kept."""
+    records = []
+    for _ in range(RESOLVED_RECORDS_CACHE_SIZE + 1):
+        record = RecordWithFiles.create({}, **input_data)
+        record.commit()
+        records.append(record)
+    db.session.commit()
+
+    for record in records:
+        file_service.list_files(identity_simple, record["id"])
+
+    cached = g._files_service_records
+    assert len(cached) == RESOLVED_RECORDS_CACHE_SIZE
+    assert (RecordWithFiles, records[0]["id"]) not in cached
+    assert (RecordWithFiles, records[-1]["id"]) in cached
+
+
+def test_read_reuses_permission_grant(
+    file_service, location, example_file_record, identity_simple
+):
+    """Test that a permission granted for a file is not evaluated again."""
+    recid = example_file_record["id"]
+    file_service.init_files(identity_simple, recid, [{"key": "article.txt"}])
+
+    with patch.object(
+        FileService,
+        "check_permission",
+        autospec=True,
+        side_effect=FileService.check_permission,
+    ) as check_permission:
+        file_service.read_file_metadata(identity_simple, recid, "article.txt")
+        file_service.read_file_metadata(identity_simple, recid, "article.txt")
+        assert check_permission.call_count == 1
+
+        # writes always evaluate the permission and drop the cached grants
+        for _ in range(2):
+            file_service.update_file_metadata(
+                identity_simple, recid, "article.txt", {"metadata": {"foo": "bar"}}
+            )
+        assert check_permission.call_count == 3
+        file_service.read_file_metadata(identity_simple, recid, "article.txt")
+        file_service.read_file_metadata(identity_simple, recid, "article.txt")
+        assert check_permission.call_count == 4
+
+
+def test_list_files_builds_schema_once(
+    file_service, location, example_file_record, identity_simple
+):
+    """Test that the file schema is built once for all the listed files."""
+    recid = example_file_record["id"]
+    file_service.init_files(
+        identity_simple, recid, [{"key": "a.txt"}, {"key": "b.txt"}]
+    )
+
+    with patch.object(
+        ServiceSchemaWrapper,
+        "dumper",
+        autospec=True,
+        side_effect=ServiceSchemaWrapper.dumper,
+    ) as dumper:
+        result = file_service.list_files(identity_simple, recid).to_dict()
+        assert sorted(e["key"] for e in result["entries"]) == ["a.txt", "b.txt"]
+        assert dumper.call_count == 1
+
+
 def test_retrieve_non_existing_file(
     file_service, location, example_file_record, identity_simple, db
 ):
@@ -336,6 +438,69 @@ def test_fetch_unreadable_file(
     assert result.to_dict()["entries"][0]["transfer"]["error"] == "not found"
 
 
+@patch("invenio_records_resources.services.files.tasks.requests.get")
+def test_fetch_file_commit_error(
+    p_response_raw,
+    mock_request,
+    file_service,
+    example_file_record,
+    identity_simple,
+    location,
+):
+    """Test that the fetched content is kept when committing the file fails."""
+    p_response_raw.return_value = mock_request
+
+    recid = example_file_record["id"]
+    file_to_initialise = [
+        {
+            "key": "article.txt",
+            "transfer": {
+                "url": "https://inveniordm.test/files/article.txt",
+                "type": "F",
+            },
+        }
+    ]
+
+    with patch.object(
+        FileService, "commit_file", side_effect=Exception("commit failed")
+    ):
+        file_service.init_files(identity_simple, recid, file_to_initialise)
+
+    result = file_service.read_file_metadata(identity_simple, recid, "article.txt")
+    result = result.to_dict()
+    assert result["transfer"]["error"] == "commit failed"
+    # the written content is still referenced in the bucket
+    record = RecordWithFiles.pid.resolve(recid)
+    obj = ObjectVersion.query.filter_by(
+        bucket_id=record.bucket_id, key="article.txt"
+    ).one()
+    assert obj.file.uri
+
+
+@patch("invenio_records_resources.services.files.transfer.providers.fetch.fetch_file")
+def test_init_mixed_transfer_files_order(
+    p_fetch_file, file_service, example_file_record, identity_simple, location
+):
+    """Test that local and fetched files are initialized in input order."""
+    recid = example_file_record["id"]
+
+    def _fetched(key):
+        url = f"https://inveniordm.test/files/{key}"
+        return {"key": key, "transfer": {"type": "F", "url": url}}
+
+    file_to_initialise = [
+        _fetched("a.txt"),
+        {"key": "b.txt"},
+        {"key": "c.txt"},
+        _fetched("d.txt"),
+        {"key": "e.txt"},
+    ]
+    result = file_service.init_files(identity_simple, recid, file_to_initialise)
+
+    keys = [entry["key"] for entry in result.to_dict()["entries"]]
+    assert keys == ["a.txt", "b.txt", "c.txt", "d.txt", "e.txt"]
+
+
 @patch("invenio_records_resources.services.files.tasks.requests.get")
 @patch("invenio_records_resources.services.files.transfer.providers.fetch.fetch_file")
 def test_content_and_commit_fetched_file(
@@ -18,6 +18,11 @@ Test to add:
 import pytest
 from invenio_pidstore.errors import PIDDeletedError
 
+from invenio_records_resources.services.uow import (
+    RecordCommitOp,
+    RecordIndexOp,
+    UnitOfWork,
+)
 from tests.mock_module.api import Record
 
 
@@ -127,3 +132,83 @@ def test_read_many_no_filter(app, search_clear, service, identity_simple, input_
         assert record["id"] is not None
         assert record["metadata"]["title"] == "Test"
         assert record["metadata"]["type"]["type"] == "test"
+
+
+class FakeIndexer:
+    """Indexer collecting the indexed records."""
+
+    def __init__(self, index="records"):
+        """Constructor."""
+        self.index_name = index
+        self.indexed = []
+
+    def record_to_index(self, record):
+        """Get the index of a record."""
+        return self.index_name
+
+    def index(self, record, arguments=None):
+        """Index a record."""
+        self.indexed.append(record)
+
+
+class FakeRecord:
+    """Record keeping track of its commits."""
+
+    def __init__(self, id_):
+        """Constructor."""
+        self.id = id_
+        self.committed = False
+
+    def commit(self):
+        """Commit the record."""
+        self.committed = True
+
+
+class FakeDraft(FakeRecord):
+    """Draft sharing its id with the published record."""
+
+
+def test_uow_indexes_record_once(base_app, db):
+    """Test that a record committed several times in a unit of work is indexed once."""
+    # services build a new indexer instance for each operation
+    indexer, last_indexer = FakeIndexer(), FakeIndexer()
+    # two revisions of the same record and another record
+    first, last, other = FakeRecord("a"), FakeRecord("a"), FakeRecord("b")
+
+    with UnitOfWork(db.session) as uow:
+        uow.register(RecordCommitOp(first, indexer))
+        uow.register(RecordCommitOp(other, indexer))
+        uow.register(RecordCommitOp(last, last_indexer))
+        uow.commit()
+
+    assert first.committed and last.committed
+    assert indexer.indexed == [other]
+    assert last_indexer.indexed == [last]
+
+
+def test_uow_indexes_records_sharing_id(base_app, db):
+    """Test that records of different classes with the same id are all indexed."""
+    draft_indexer, record_indexer = FakeIndexer(), FakeIndexer()
+    draft, record = FakeDraft("a"), FakeRecord("a")
+
+    with UnitOfWork(db.session) as uow:
+        uow.register(RecordCommitOp(draft, draft_indexer))
+        uow.register(RecordCommitOp(record, record_indexer))
+        uow.commit()
+
+    assert draft_indexer.indexed == [draft]
+    assert record_indexer.indexed == [record]
+
+
+def test_uow_indexes_record_in_each_index(base_app, db):
+    """Test that a record indexed in different indices is indexed in each."""
+    indexer, other_indexer = FakeIndexer(), FakeIndexer(index="other")
+    record = FakeRecord("a")
+
+    with UnitOfWork(db.session) as uow:
+        uow.register(RecordCommitOp(record, indexer))
+        uow.register(RecordIndexOp(record, other_indexer))
+        uow.commit()
+
+    assert indexer.indexed == [record]
+    assert other_indexer.indexed == [record]
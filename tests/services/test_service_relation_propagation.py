@@ -155,32 +155,65 @@ def test_on_relation_update_limit(mocker, identity_simple, service_wrel):
             identity_simple, "mock-records", records_list, notif_time, limit
         )
 
+    def _chunks(call):
+        """Return the number of recids of each chunk of a reindex call."""
+        _, _, kwargs = call
+        clauses = kwargs["search_query"].to_dict()["bool"]["should"]
+        return [len(c["terms"]["metadata.inner_record.id"]) for c in clauses]
+
     _call(n_records=3, limit=5)
-    # below the limit - expected: 1 call, 3 clauses
-    mocked_reindex.call_count == 1
-    _, _, kwargs = mocked_reindex.mock_calls[0]
-    clauses = kwargs["search_query"].to_dict()["bool"]["should"]
-    assert len(clauses) == 3
+    # below the limit - expected: 1 call, 1 chunk of 3 recids
+    assert mocked_reindex.call_count == 1
+    assert _chunks(mocked_reindex.mock_calls[0]) == [3]
 
     mocked_reindex.reset_mock()
 
     _call(n_records=5, limit=5)
-    # on the limit - expected: 1 call, 5 clauses
-    mocked_reindex.call_count == 1
-    _, _, kwargs = mocked_reindex.mock_calls[0]
-    clauses = kwargs["search_query"].to_dict()["bool"]["should"]
-    assert len(clauses) == 5
+    # on the limit - expected: 1 call, 1 chunk of 5 recids
+    assert mocked_reindex.call_count == 1
+    assert _chunks(mocked_reindex.mock_calls[0]) == [5]
 
     mocked_reindex.reset_mock()
 
     _call(n_records=8, limit=5)
-    # over the limit - expected: 2 calls, 5 clauses
-    mocked_reindex.call_count == 2
+    # over the limit - expected: 1 call, 2 chunks
+    assert mocked_reindex.call_count == 1
+    assert _chunks(mocked_reindex.mock_calls[0]) == [5, 3]
+
+    mocked_reindex.reset_mock()
+
+    _call(n_records=28, limit=5)
+    # over the limit of chunks - expected: 2 calls, 6 chunks
+    assert mocked_reindex.call_count == 2
     # first call
-    _, _, kwargs = mocked_reindex.mock_calls[0]
-    clauses = kwargs["search_query"].to_dict()["bool"]["should"]
-    assert len(clauses) == 5
+    assert _chunks(mocked_reindex.mock_calls[0]) == [5, 5, 5, 5, 5]
     # second call
-    _, _, kwargs = mocked_reindex.mock_calls[1]
-    clauses = kwargs["search_query"].to_dict()["bool"]["should"]
-    assert len(clauses) == 3
+    assert _chunks(mocked_reindex.mock_calls[1]) == [3]
+
+
+def test_on_relation_update_parallel_lists(mocker, identity_simple, service_wrel):
+    """Test on relation update with the records info as parallel lists."""
+    notif_time = arrow.utcnow().strftime("%Y-%m-%dT%H:%M:%S.%f")
+    mocked_reindex = mocker.patch.object(RecordService, "reindex")
+
+    records_info = {
+        "recids": ["1", "2", "3"],
+        "uuids": ["a", "b", "c"],
+        "revision_ids": [1, 2, 3],
+    }
+    service_wrel.on_relation_update(
+        identity_simple, "mock-records", records_info, notif_time, 2
+    )
+    records_list = list(zip(*records_info.values()))
+    service_wrel.on_relation_update(
+        identity_simple, "mock-records", records_list, notif_time, 2
+    )
+
+    assert mocked_reindex.call_count == 2
+    first, second = [c.kwargs["search_query"] for c in mocked_reindex.mock_calls]
+    assert first == second
+    clauses = first.to_dict()["bool"]["should"]
+    assert [c["terms"]["metadata.inner_record.id"] for c in clauses] == [
+        ["1", "2"],
+        ["3"],
+    ]